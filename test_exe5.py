@@ -304,6 +304,37 @@ class TestMinibar(unittest.TestCase):
         self.assertEqual(minibar.drinks, {})
         mock_print.assert_called_once_with("The drink coke was not found.")
 
+    @patch('builtins.print')  # Mock the print function
+    def test_drink_last_item_only_once(self, mock_print):
+        """Tests that the last unit of a drink can be billed only once."""
+        self.minibar3.drink('Coke')
+        self.minibar3.drink('Coke')
+        self.minibar3.drink('Coke')
+        self.minibar3.drink('Coke')  # Already sold out
+        self.assertEqual(self.minibar3.bill, 63)
+        self.assertEqual(self.minibar3.drinks, {'BEER': 5, 'WaTeR': 10})
+        mock_print.assert_called_once_with("The drink coke was not found.")
+
+    @patch('builtins.print')  # Mock the print function
+    def test_eat_same_snack_twice(self, mock_print):
+        """Tests that a snack can be billed only once."""
+        self.minibar3.eat('Cake')
+        self.minibar3.eat('cake')  # Already eaten
+        self.assertEqual(self.minibar3.bill, 40)
+        self.assertEqual(self.minibar3.snacks, {'M&M': 10, 'cookies': 23})
+        mock_print.assert_called_once_with("The snack cake was not found.")
+
+    # ----------- Tests for bill ----------- #
+    def test_bill_flat_drink_price_and_snack_price(self):
+        """Tests that every drink costs the same and every snack costs its listed price."""
+        self.minibar3.drink('beer')
+        self.minibar3.drink('Coke')
+        self.minibar3.drink('WATER')
+        self.assertEqual(self.minibar3.bill, 63)  # 3 drinks, 21 each
+        self.minibar3.eat('Cake')
+        self.minibar3.eat('COOKIES')
+        self.assertEqual(self.minibar3.bill, 63 + 40 + 23)
+
     # ----------- Tests for __repr__ ----------- #
     def test_repr_with_full_minibar(self):
         """Tests __repr__ with drinks and snacks available, and no bill."""
@@ -343,6 +374,14 @@ class TestMinibar(unittest.TestCase):
         output = repr(self.minibar4)  # Use an example minibar with drinks and snacks
         self.assertFalse(output.endswith('\n'), "Output should not end with a newline.")
 
+    def test_repr_updates_after_drink_and_eat(self):
+        """Tests that __repr__ reflects every drink/eat, even after it was already rendered."""
+        self.assertEqual(repr(self.minibar5), "Drinks: Water (1)\nSnacks: M&M (10)\nNo bill yet")
+        self.minibar5.drink('water')
+        self.assertEqual(repr(self.minibar5), "No drinks left\nSnacks: M&M (10)\nBill: 21")
+        self.minibar5.eat('m&m')
+        self.assertEqual(repr(self.minibar5), "No drinks left\nNo snacks left\nBill: 31")
+
     # ----------- Tests for class Room ----------- #
 
 
@@ -481,6 +520,28 @@ class TestRoom(unittest.TestCase):
             Room(self.minibar, 141, ["Dana"], 5, True, 0.5)
             mock_print.assert_called_once_with("value error")
 
+    def test_edge_case_highest_room_on_floor(self):
+        """Tests the highest valid room on a floor (40)."""
+        with patch('builtins.print') as mock_print:
+            Room(self.minibar, 140, ["Dana"], 5, True, 0.5)
+            mock_print.assert_not_called()
+
+    def test_value_error_highest_floor_invalid_room(self):
+        """Tests value error for the highest floor with an invalid room number."""
+        with patch('builtins.print') as mock_print:
+            Room(self.minibar, 941, ["Dana"], 5, True, 0.5)
+            mock_print.assert_called_once_with("value error")
+
+    def test_errors_printed_once_per_room(self):
+        """Tests that each invalid room prints its own error, once."""
+        with patch('builtins.print') as mock_print:
+            Room(self.minibar, 101, ["Dana", 123], "clean", True, 0.5)
+            Room(self.minibar, 101, ["Dana"], 5, True, 0.5)
+            Room(self.minibar, 150, ["Dana"], 5, True, 1.5)
+            Room(self.minibar, 101, ["Dana", 123], "clean", True, 0.5)
+            self.assertEqual([c.args for c in mock_print.call_args_list],
+                             [("type error",), ("value error",), ("type error",)])
+
     def test_type_error_and_value_error_only_type_printed(self):
         """Tests both type and value errors but only type error is printed."""
         with patch('builtins.print') as mock_print:
@@ -577,6 +638,23 @@ class TestRoom(unittest.TestCase):
             Room({}, 101, ["Dana"], 5, True, 1.5)  # Invalid minibar and satisfaction
             mock_print.assert_called_once_with("value error")
 
+    # ----------- Tests for attributes ----------- #
+
+    def test_attributes(self):
+        """Tests that all constructor arguments are exposed as attributes."""
+        room = Room(self.minibar, 101, ["Dana", "Ron"], 5, True, 0.7)
+        self.assertIs(room.minibar, self.minibar)  # Same minibar object, not a copy
+        self.assertEqual(room.number, 101)
+        self.assertEqual(room.guests, ["dana", "ron"])
+        self.assertEqual(room.clean_level, 5)
+        self.assertIs(room.is_suite, True)
+        self.assertEqual(room.satisfaction, 0.7)
+
+    def test_attributes_default_satisfaction(self):
+        """Tests that satisfaction defaults to 0.5."""
+        room = Room(self.minibar, 101, [], 5, False)
+        self.assertEqual(room.satisfaction, 0.5)
+
     # ----------- Tests for __repr__ ----------- #
 
     def test_repr_empty_all(self):
@@ -666,6 +744,34 @@ class TestRoom(unittest.TestCase):
                            'No bill yet')
         self.assertEqual(repr(room), expected_output)
 
+    def test_repr_updates_after_state_changes(self):
+        """Tests that repr is rebuilt after check_in, clean, move_to and check_out."""
+        room1 = Room(self.empty_minibar, 101, [], 6, True)
+        room2 = Room(Minibar({}, {}), 102, [], 4, False)
+        self.assertIn('Guests: empty\n', repr(room1))
+
+        room1.check_in(["Shir", "Ronen"])
+        self.assertIn('Guests: ronen, shir\n', repr(room1))
+
+        room1.clean()
+        self.assertIn('Clean level: 8\n', repr(room1))
+
+        room1.minibar.bill = 21
+        room1.move_to(room2)
+        self.assertIn('Guests: empty\n', repr(room1))
+        self.assertEqual(repr(room2), ('Room number: 102\n'
+                                       'Guests: ronen, shir\n'
+                                       'Clean level: 4\n'
+                                       'Is suite: False\n'
+                                       'Satisfaction: 0.5\n'
+                                       'Minibar:\n'
+                                       'No drinks left\n'
+                                       'No snacks left\n'
+                                       'Bill: 21'))
+
+        room2.check_out()
+        self.assertIn('Guests: empty\n', repr(room2))
+
     # ----------- Tests for is_occupied ----------- #
 
     def test_is_occupied_invalid_is_suite(self):
@@ -703,6 +809,14 @@ class TestRoom(unittest.TestCase):
         room = Room(self.empty_minibar, 101, [], 6, True)  # השתמשתי ב-empty_minibar
         self.assertFalse(room.is_occupied())
 
+    def test_is_occupied_after_guests_assignment(self):
+        """Tests is_occupied after assigning the guests attribute directly."""
+        room = Room(self.empty_minibar, 101, [], 6, True)
+        room.guests = ["Dana"]
+        self.assertTrue(room.is_occupied())
+        room.guests = []
+        self.assertFalse(room.is_occupied())
+
     # ----------- Tests for clean ----------- #
 
     def test_clean_with_non_numeric_room_number(self):
@@ -726,6 +840,52 @@ class TestRoom(unittest.TestCase):
         room.clean()
         self.assertEqual(room.clean_level, initial_clean_level + 1)
 
+    def test_clean_repeated_on_many_rooms(self):
+        """Tests repeated cleaning of suites and regular rooms sharing a minibar."""
+        suite = Room(self.minibar, 101, [], 1, True)
+        regular = Room(self.minibar, 102, ["Dana"], 1, False)
+        untouched = Room(self.minibar, 103, [], 1, True)
+        for _ in range(3):
+            for room in (suite, regular):
+                room.clean()
+        self.assertEqual(suite.clean_level, 7)  # +2 per clean
+        self.assertEqual(regular.clean_level, 4)  # +1 per clean
+        self.assertEqual(untouched.clean_level, 1)  # Not cleaned
+
+    # ----------- Tests for better_than ----------- #
+
+    def test_better_than_suite_over_regular(self):
+        """Tests that a suite is better than a regular room regardless of clean level."""
+        suite = Room(self.empty_minibar, 101, [], 1, True)
+        regular = Room(self.empty_minibar, 102, [], 9, False)
+        self.assertTrue(suite.better_than(regular))
+        self.assertFalse(regular.better_than(suite))
+
+    def test_better_than_equal_rooms(self):
+        """Tests that neither of two equal rooms is better than the other."""
+        room1 = Room(self.empty_minibar, 101, [], 5, False)
+        room2 = Room(self.empty_minibar, 102, [], 5, False)
+        self.assertFalse(room1.better_than(room2))
+        self.assertFalse(room2.better_than(room1))
+
+    def test_better_than_after_clean(self):
+        """Tests that better_than reflects clean level changes made by clean()."""
+        room1 = Room(self.empty_minibar, 101, [], 5, False)
+        room2 = Room(self.empty_minibar, 102, [], 6, False)
+        self.assertTrue(room2.better_than(room1))
+        room1.clean()
+        self.assertFalse(room2.better_than(room1))
+        room1.clean()
+        self.assertTrue(room1.better_than(room2))
+
+    def test_better_than_after_clean_level_assignment(self):
+        """Tests that better_than reflects clean levels assigned directly."""
+        room1 = Room(self.empty_minibar, 101, [], 5, True)
+        room2 = Room(self.empty_minibar, 102, [], 6, True)
+        self.assertTrue(room2.better_than(room1))
+        room1.clean_level = 8
+        self.assertTrue(room1.better_than(room2))
+
     # ----------- Tests for check-in ----------- #
 
     def test_check_in_occupied_room_invalid_suite(self):
@@ -904,6 +1064,26 @@ class TestRoom(unittest.TestCase):
         # Satisfaction copied (other room is worse)
         self.assertEqual(room2.satisfaction, 0.9)
 
+    def test_move_to_failure_changes_nothing(self):
+        """Ensure a rejected move leaves guests, bills and satisfaction of both rooms untouched."""
+        room1 = Room(Minibar({}, {}), 101, ["Alice"], 5, False, 0.8)
+        room2 = Room(Minibar({}, {}), 201, ["Charlie"], 6, True, 0.7)
+        room3 = Room(Minibar({}, {}), 202, [], 7, True, 0.6)
+        room4 = Room(Minibar({}, {}), 203, [], 4, False, 0.9)
+        room1.minibar.bill = 40
+        room2.minibar.bill = 10
+        room3.minibar.bill = 30
+        room4.minibar.bill = 15
+
+        with patch('builtins.print'):
+            room1.move_to(room2)  # Target occupied
+            room3.move_to(room4)  # Source empty
+
+        self.assertEqual((room1.guests, room1.minibar.bill, room1.satisfaction), (["alice"], 40, 0.8))
+        self.assertEqual((room2.guests, room2.minibar.bill, room2.satisfaction), (["charlie"], 10, 0.7))
+        self.assertEqual((room3.guests, room3.minibar.bill, room3.satisfaction), ([], 30, 0.6))
+        self.assertEqual((room4.guests, room4.minibar.bill, room4.satisfaction), ([], 15, 0.9))
+
     # ----------- Tests based on pdf ----------- #
     def test_first_image_operations(self):
         """Tests room operations based on the first image."""
@@ -1117,6 +1297,52 @@ class TestHotel(unittest.TestCase):
         hotel = Hotel("NoMinibarHotel", rooms)
         self.assertEqual(repr(hotel), "NoMinibarHotel Hotel has: 2/3 occupied rooms.")
 
+    # 14. Test for a hotel whose rooms are changed after the hotel was created
+    def test_rooms_changed_after_creation(self):
+        """Test repr reflects room attributes assigned directly after creating the hotel."""
+        self.regular_room.guests = ["Dana"]
+        self.occupied_regular.guests = []
+        self.better_suite.guests = ["Eve", "Frank"]
+        self.assertEqual(repr(self.princess_hotel), "Princess Hotel Hotel has: 3/6 occupied rooms.")
+
+    # 15. Test for a hotel whose occupancy changes through hotel and room operations
+    def test_repr_after_operations(self):
+        """Test repr after check-in, check-out, upgrade and room operations."""
+        self.assertEqual(repr(self.princess_hotel), "Princess Hotel Hotel has: 2/6 occupied rooms.")
+        self.princess_hotel.check_in(["Charlie"], True)
+        self.assertEqual(repr(self.princess_hotel), "Princess Hotel Hotel has: 3/6 occupied rooms.")
+        self.princess_hotel.upgrade("Bob")
+        self.assertEqual(repr(self.princess_hotel), "Princess Hotel Hotel has: 3/6 occupied rooms.")
+        self.princess_hotel.check_out("Alice")
+        self.assertEqual(repr(self.princess_hotel), "Princess Hotel Hotel has: 2/6 occupied rooms.")
+        self.regular_room.check_in(["Dana"])
+        self.assertEqual(repr(self.princess_hotel), "Princess Hotel Hotel has: 3/6 occupied rooms.")
+        self.regular_room.move_to(self.better_regular)
+        self.assertEqual(repr(self.princess_hotel), "Princess Hotel Hotel has: 3/6 occupied rooms.")
+        self.better_regular.check_out()
+        self.assertEqual(repr(self.princess_hotel), "Princess Hotel Hotel has: 2/6 occupied rooms.")
+
+    # 16. Test for a hotel with every valid room number
+    def test_large_hotel(self):
+        """Test operations on a hotel with all 360 valid room numbers."""
+        rooms = []
+        for floor in range(1, 10):
+            for number in range(floor * 100 + 1, floor * 100 + 41):
+                guests = ["Guest" + str(number)] if number % 4 == 0 else []  # Every 4th room occupied
+                clean_level = {938: 9, 939: 8}.get(number, 5)  # 938 best suite, 939 best regular
+                rooms.append(Room(Minibar({}, {}), number, guests, clean_level, number % 2 == 0))
+        hotel = Hotel("Large", rooms)
+        self.assertEqual(repr(hotel), "Large Hotel has: 90/360 occupied rooms.")
+
+        self.assertEqual(hotel.check_in(["Alice"], True).number, 938)
+        self.assertEqual(hotel.check_in(["Bob"], False).number, 939)
+        self.assertIsNone(hotel.upgrade("guest316"))  # Best suite already taken
+        self.assertEqual(hotel.check_out("GUEST 520").number, 520)
+        room = hotel.send_cleaner("guest124")
+        self.assertEqual(room.number, 124)
+        self.assertEqual(room.clean_level, 7)  # Suite clean level increases by 2
+        self.assertEqual(repr(hotel), "Large Hotel has: 91/360 occupied rooms.")
+
     # ----------- Tests check_in ----------- #
 
     # 1. Test check-in to an available suite
@@ -1181,6 +1407,49 @@ class TestHotel(unittest.TestCase):
         self.assertEqual(assigned_room, self.better_regular)  # Should assign the room
         self.assertEqual(assigned_room.guests, ["john smith", "jane doe"])  # Names checked in (lowercase)
 
+    # 7. Test consecutive check-ins do not reuse an assigned room
+    def test_check_in_consecutive_suites(self):
+        """Test that a second check-in gets the next suite and keeps the first guests."""
+        first_room = self.princess_hotel.check_in(["Charlie"], True)
+        with patch('builtins.print') as mock_print:
+            second_room = self.princess_hotel.check_in(["Dana"], True)
+            mock_print.assert_not_called()  # Never tries an occupied room
+        self.assertEqual(first_room, self.better_suite)
+        self.assertEqual(second_room, self.suite_room)
+        self.assertEqual(first_room.guests, ["charlie"])
+        self.assertEqual(second_room.guests, ["dana"])
+
+    # 8. Test check-in picks a suite that became the best after cleaning
+    def test_check_in_after_clean(self):
+        """Test that check-in picks a suite that was cleaned above the previous best."""
+        self.suite_room.clean()  # 101: 5 -> 7
+        self.assertEqual(self.princess_hotel.check_in(["Charlie"], True), self.better_suite)
+        self.princess_hotel.check_out("Charlie")
+        self.suite_room.clean()  # 101: 7 -> 9
+        self.assertEqual(self.princess_hotel.check_in(["Dana"], True), self.suite_room)
+
+    # 9. Test check-in reuses a room emptied by check-out
+    def test_check_in_after_check_out(self):
+        """Test that a room freed by check-out is available for check-in again."""
+        self.assertEqual(self.princess_hotel.check_in(["Eve"], False), self.better_regular)
+        self.assertEqual(self.princess_hotel.check_in(["Frank"], False), self.regular_room)
+        self.assertIsNone(self.princess_hotel.check_in(["Grace"], False))
+        self.princess_hotel.check_out("Eve")
+        assigned_room = self.princess_hotel.check_in(["Grace"], False)
+        self.assertEqual(assigned_room, self.better_regular)
+        self.assertEqual(assigned_room.guests, ["grace"])
+
+    # 10. Test a group of check-ins with mixed room types
+    def test_check_in_group_mixed_types(self):
+        """Test a sequence of suite and regular check-ins until the hotel is full."""
+        requests = [(["Charlie"], True), (["Dana", "Eve"], False), (["Frank"], True),
+                    (["Grace"], False), (["Heidi"], True), (["Ivan"], False)]
+        assigned_rooms = [self.princess_hotel.check_in(guests, is_suite) for guests, is_suite in requests]
+        self.assertEqual(assigned_rooms, [self.better_suite, self.better_regular, self.suite_room,
+                                          self.regular_room, None, None])
+        self.assertEqual(self.better_regular.guests, ["dana", "eve"])
+        self.assertEqual(repr(self.princess_hotel), "Princess Hotel Hotel has: 6/6 occupied rooms.")
+
     # ----------- Tests check_out ----------- #
 
     # 1. Test case-sensitive check-out (guest name exactly matches)
@@ -1258,6 +1527,16 @@ class TestHotel(unittest.TestCase):
         room = self.princess_hotel.check_out("")  # Empty string
         self.assertIsNone(room)  # Should return None
 
+    # 10. Test check-out of guests checked in through the hotel
+    def test_check_out_after_hotel_check_in(self):
+        """Test check-out finds guests checked in by the hotel, in any case and spacing."""
+        assigned_room = self.princess_hotel.check_in(["Charlie", "Dana"], True)
+        room = self.princess_hotel.send_cleaner(" CHARLIE ")
+        self.assertIs(room, assigned_room)
+        room = self.princess_hotel.check_out("d a n a")
+        self.assertIs(room, assigned_room)
+        self.assertEqual(room.guests, [])
+
     # ----------- Tests for upgrade method -----------#
 
     # 1. Upgrade guest to the first better suite
@@ -1316,6 +1595,26 @@ class TestHotel(unittest.TestCase):
         room = self.princess_hotel.upgrade("UnknownGuest")
         self.assertIsNone(room)
 
+    # 11. Upgrade to a room that became better after cleaning
+    def test_upgrade_after_clean(self):
+        """Test that a room cleaned above the other empty rooms is chosen for the upgrade."""
+        self.suite_room.clean()
+        self.suite_room.clean()  # 101: 5 -> 9, now better than Alice's 103 and 105
+        room = self.princess_hotel.upgrade("Alice")
+        self.assertEqual(room.number, 101)
+        self.assertEqual(room.guests, ["alice"])
+
+    # 12. Upgrade skips better rooms that were filled
+    def test_upgrade_after_better_rooms_filled(self):
+        """Test that upgrade skips better rooms that are occupied."""
+        self.suite_room.clean()  # 101: 5 -> 7
+        self.suite_room.check_in(["Eve"])
+        room = self.princess_hotel.upgrade("Alice")
+        self.assertEqual(room.number, 105)
+        self.princess_hotel.check_out("Eve")
+        room = self.princess_hotel.upgrade("Alice")
+        self.assertIsNone(room)  # 105 is now the best room
+
     # ----------- Tests for send_cleaner() method -----------#
 
     # 1. Test cleaning a room where the guest exists
@@ -1380,6 +1679,24 @@ class TestHotel(unittest.TestCase):
         self.assertEqual(room.number, 104)  # Room with Bob and Tom
         self.assertEqual(room.clean_level, 6)  # Clean level increases
 
+    # 7. Test cleaning after the guest was upgraded to another room
+    def test_send_cleaner_after_upgrade(self):
+        """Test that the cleaner is sent to the guest's new room after an upgrade."""
+        self.princess_hotel.upgrade("Alice")  # Alice moves from 103 to 105
+
+        room = self.princess_hotel.send_cleaner("alice")
+        self.assertEqual(room.number, 105)
+        self.assertEqual(room.clean_level, 10)  # Suite clean level increases by 2
+        self.assertEqual(self.occupied_suite.clean_level, 5)  # Old room untouched
+
+    # 8. Test cleaning after a guest was removed by reassigning guests
+    def test_send_cleaner_after_guests_reassigned(self):
+        """Test that a guest removed by assigning guests directly is no longer found."""
+        self.occupied_regular.guests = ["Tom"]
+        self.assertIsNone(self.princess_hotel.send_cleaner("Bob"))
+        self.assertIsNone(self.princess_hotel.check_out("Bob"))
+        self.assertEqual(self.princess_hotel.send_cleaner("TOM"), self.occupied_regular)
+
 
 class TestPolynomial(unittest.TestCase):
 